@@ -4,10 +4,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import re
-import math
-from collections import Counter
-import operator
+from warmup import DEFAULT_MOVIE_INDEX, start_warmup
 
 st.set_page_config(page_title='Movie Analysis', page_icon=':movie_camera:')
 
@@ -60,88 +57,8 @@ data_actors_series = load_actors_series()
 data_age = load_actors_age()
 data_movies = load_movies()
 
-# Cosine Algorithm Class
-class CosineSimilarity:
-    def __init__(self):
-        print("Cosine Similarity initialized")
-
-    @staticmethod
-    def cosine_similarity_of(text1, text2):
-        # Get words first
-        first = re.compile(r"[\w']+").findall(text1)
-        second = re.compile(r"[\w']+").findall(text2)
-
-        # Get dictionary with each word and count
-        vector1 = Counter(first)
-        vector2 = Counter(second)
-
-        # Convert vectors to set to find common words as intersection
-        common = set(vector1.keys()).intersection(set(vector2.keys()))
-
-        dot_product = 0.0
-
-        for i in common:
-            # Get amount of each common word for both vectors and multiply them then add them together
-            dot_product += vector1[i] * vector2[i]
-
-        squared_sum_vector1 = 0.0
-        squared_sum_vector2 = 0.0
-
-        # Get squared sum values of word counts from each vector
-        for i in vector1.keys():
-            squared_sum_vector1 += vector1[i]**2
-
-        for i in vector2.keys():
-            squared_sum_vector2 += vector2[i]**2
-
-        #calculate magnitude with squared sums.
-        magnitude = math.sqrt(squared_sum_vector1) * math.sqrt(squared_sum_vector2)
-
-        if not magnitude:
-           return 0.0
-        else:
-           return float(dot_product) / magnitude
-       
-
-# Recommendations Engine Class
-class RecommenderEngine:
-    def __init__(self):
-        print("engine initialized")
-
-    def get_recommendations(keywords):
-
-        df = data_movies
-        df.reset_index(inplace=True, drop=True)        
-
-        score_dict = {}
-        
-        # Obtaining the score by the cosine similarity method
-        for index, row in df.iterrows():
-            score_dict[index] = CosineSimilarity.cosine_similarity_of(row['data'], keywords)
-
-        # Sort movies by score and index
-        sorted_scores = sorted(score_dict.items(), key=operator.itemgetter(1), reverse=True)
-
-        counter = 0
-
-        # Create an empty results data frame
-        resultDF = pd.DataFrame(columns=('tconst', 'originalTitle', 'data', 'score'))
-
-        # Get highest scored 10 movies.
-        for i in sorted_scores:
-
-            resultDF = resultDF.append({'tconst': df.iloc[i[0]]['tconst'], 'originalTitle': df.iloc[i[0]]['originalTitle'], 'data': df.iloc[i[0]]['data'], 'score': i[1]}, ignore_index=True)
-            counter += 1
-
-            if counter>10:
-                break
-
-        # remove the first row
-        return resultDF.iloc[1:]
-    
-
-def get_recommendations(keywords):
-    return RecommenderEngine.get_recommendations(keywords)
+# Recommendations warm-up, shared by every session of the process
+warmup = start_warmup()
 
 
 def main():
@@ -163,6 +80,13 @@ def main():
     with st.sidebar:
         page = st.selectbox("Choose a page", tuple(pages.keys()))
 
+        status = warmup.status()
+        if status['state'] == 'failed':
+            st.caption(f"Recommendations warm-up failed: {status['error']}")
+        elif status['state'] != 'ready':
+            st.caption(f"Warming up recommendations: {status['done']}/{status['total']} movies")
+            st.progress(status['done'] / max(status['total'], 1))
+
     pages[page]()
 
 
@@ -644,10 +568,9 @@ def recommendations():
     'Finally we have built a recommendations engine that will provide a list of 10 movies based on one that you can select here. Please note that only movies rated 6.0 or more on the IMDb are present in the list. There are a bit more than 23 000 movies in the database.'
     'The dropdown menu will show as the default choice the movie A.I. Artificial Intelligence, as a tribute to this area we are barely touching here.'
     
-    movie_title = st.selectbox('Select a movie to get recommendations for:', data_movies.originalTitle, index=10243)
+    movie_title = st.selectbox('Select a movie to get recommendations for:', data_movies.originalTitle, index=DEFAULT_MOVIE_INDEX)
     
-    movie_data = data_movies.loc[data_movies['originalTitle']==movie_title,'data'].values[0]
-    recommendations = get_recommendations(movie_data)
+    recommendations = warmup.get_recommendations(movie_title, data_movies)
     
     'Here are the results!'
     'Click on the movies to open its page on the IMDb'
@@ -0,0 +1,88 @@
+import pandas as pd
+import re
+import math
+from collections import Counter
+import operator
+
+# Cosine Algorithm Class
+class CosineSimilarity:
+    def __init__(self):
+        print("Cosine Similarity initialized")
+
+    @staticmethod
+    def cosine_similarity_of(text1, text2):
+        # Get words first
+        first = re.compile(r"[\w']+").findall(text1)
+        second = re.compile(r"[\w']+").findall(text2)
+
+        # Get dictionary with each word and count
+        vector1 = Counter(first)
+        vector2 = Counter(second)
+
+        # Convert vectors to set to find common words as intersection
+        common = set(vector1.keys()).intersection(set(vector2.keys()))
+
+        dot_product = 0.0
+
+        for i in common:
+            # Get amount of each common word for both vectors and multiply them then add them together
+            dot_product += vector1[i] * vector2[i]
+
+        squared_sum_vector1 = 0.0
+        squared_sum_vector2 = 0.0
+
+        # Get squared sum values of word counts from each vector
+        for i in vector1.keys():
+            squared_sum_vector1 += vector1[i]**2
+
+        for i in vector2.keys():
+            squared_sum_vector2 += vector2[i]**2
+
+        #calculate magnitude with squared sums.
+        magnitude = math.sqrt(squared_sum_vector1) * math.sqrt(squared_sum_vector2)
+
+        if not magnitude:
+           return 0.0
+        else:
+           return float(dot_product) / magnitude
+       
+
+# Recommendations Engine Class
+class RecommenderEngine:
+    def __init__(self):
+        print("engine initialized")
+
+    def get_recommendations(keywords, movies):
+
+        # Work on a copy so the movies data frame shared between threads is never modified
+        df = movies.reset_index(drop=True)
+
+        score_dict = {}
+        
+        # Obtaining the score by the cosine similarity method
+        for index, row in df.iterrows():
+            score_dict[index] = CosineSimilarity.cosine_similarity_of(row['data'], keywords)
+
+        # Sort movies by score and index
+        sorted_scores = sorted(score_dict.items(), key=operator.itemgetter(1), reverse=True)
+
+        counter = 0
+
+        # Create an empty results data frame
+        resultDF = pd.DataFrame(columns=('tconst', 'originalTitle', 'data', 'score'))
+
+        # Get highest scored 10 movies.
+        for i in sorted_scores:
+
+            resultDF = resultDF.append({'tconst': df.iloc[i[0]]['tconst'], 'originalTitle': df.iloc[i[0]]['originalTitle'], 'data': df.iloc[i[0]]['data'], 'score': i[1]}, ignore_index=True)
+            counter += 1
+
+            if counter>10:
+                break
+
+        # remove the first row
+        return resultDF.iloc[1:]
+    
+
+def get_recommendations(keywords, movies):
+    return RecommenderEngine.get_recommendations(keywords, movies)
@@ -0,0 +1,11 @@
+import sys
+
+from streamlit import cli as stcli
+
+from warmup import start_warmup
+
+# Start the recommendations warm-up with the process, before any visitor opens the app
+if __name__ == '__main__':
+    start_warmup()
+    sys.argv = ['streamlit', 'run', 'app.py']
+    sys.exit(stcli.main())
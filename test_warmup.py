@@ -0,0 +1,102 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import warmup
+
+MOVIES = pd.DataFrame({'tconst': ['tt1', 'tt2'], 'originalTitle': ['Warm', 'Cold'], 'data': ['1999 Drama', '2001 Comedy']})
+
+
+class RecommendationsWarmupTest(unittest.TestCase):
+    def setUp(self):
+        # Keep the health check files out of the repository
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        for name in ('WARMUP_READY_FILE', 'WARMUP_STATUS_FILE'):
+            patcher = mock.patch.object(warmup, name, os.path.join(folder.name, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.warmup = warmup.RecommendationsWarmup()
+        self.warmup.titles = ['Warm']
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def blocking_recommendations(self, results):
+        # The first call waits to be released, so that another thread can ask for the same movie meanwhile
+        def get_recommendations(keywords, movies):
+            self.calls.append(keywords)
+            result = results[len(self.calls) - 1]
+            if len(self.calls) == 1:
+                self.started.set()
+                self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return get_recommendations
+
+    def run_owner(self, outcome):
+        def owner():
+            try:
+                outcome['result'] = self.warmup.get_recommendations('Warm', MOVIES)
+            except Exception as e:
+                outcome['error'] = e
+        thread = threading.Thread(target=owner)
+        thread.start()
+        self.assertTrue(self.started.wait(5))
+        return thread
+
+    def get_while_in_flight(self):
+        waiter = {}
+        thread = threading.Thread(target=lambda: waiter.update(result=self.warmup.get_recommendations('Warm', MOVIES)))
+        thread.start()
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        self.release.set()
+        thread.join(5)
+        return waiter
+
+    def test_waiter_gets_owner_result(self):
+        result = object()
+        owner = {}
+        with mock.patch.object(warmup, 'get_recommendations', self.blocking_recommendations([result])):
+            thread = self.run_owner(owner)
+            waiter = self.get_while_in_flight()
+            thread.join(5)
+
+        self.assertIs(owner['result'], result)
+        self.assertIs(waiter['result'], result)
+        self.assertEqual(len(self.calls), 1)
+        self.assertIs(self.warmup.results['Warm'], result)
+        self.assertEqual(self.warmup.in_flight, {})
+
+    def test_waiter_computes_when_owner_fails(self):
+        result = object()
+        owner = {}
+        with mock.patch.object(warmup, 'get_recommendations', self.blocking_recommendations([ValueError('scan failed'), result])):
+            thread = self.run_owner(owner)
+            waiter = self.get_while_in_flight()
+            thread.join(5)
+
+        self.assertIsInstance(owner['error'], ValueError)
+        self.assertIs(waiter['result'], result)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.warmup.in_flight, {})
+
+    def test_other_movies_are_not_cached(self):
+        with mock.patch.object(warmup, 'get_recommendations', side_effect=lambda keywords, movies: object()) as get_recommendations:
+            first = self.warmup.get_recommendations('Cold', MOVIES)
+            second = self.warmup.get_recommendations('Cold', MOVIES)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(get_recommendations.call_count, 2)
+        self.assertNotIn('Cold', self.warmup.results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import json
+import logging
+import os
+import threading
+
+import pandas as pd
+
+from recommender import get_recommendations
+
+logger = logging.getLogger(__name__)
+
+# Default movie of the recommendations dropdown (A.I. Artificial Intelligence)
+DEFAULT_MOVIE_INDEX = 10243
+
+MOVIES_FILE = 'data/movies_merged.csv.zip'
+
+# Movies precomputed at startup (any CSV with a tconst column)
+WARMUP_TITLES_FILE = os.environ.get('WARMUP_TITLES_FILE', 'data/movies_ratings.csv.zip')
+
+# Files created for the health checks: the ready file once the warm-up is over,
+# and the status file updated after every movie
+WARMUP_READY_FILE = os.environ.get('WARMUP_READY_FILE', '.warmup_ready')
+WARMUP_STATUS_FILE = os.environ.get('WARMUP_STATUS_FILE', '.warmup_status.json')
+
+
+# Recommendations Warm-up Class
+class RecommendationsWarmup:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+        self.in_flight = {}
+        self.titles = []
+        self.done = 0
+        self.failed = 0
+        self.missing = 0
+        self.state = 'starting'
+        self.error = None
+
+        # Remove the readiness file left by a previous run
+        if os.path.exists(WARMUP_READY_FILE):
+            os.remove(WARMUP_READY_FILE)
+        self.write_status()
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name='recommendations-warmup', daemon=True)
+        thread.start()
+
+    def run(self):
+        try:
+            # The warm-up uses its own copy of the movies, not the one cached by Streamlit
+            movies = pd.read_csv(MOVIES_FILE)
+
+            # The default movie first, then the popular ones found in the database
+            popular = pd.read_csv(WARMUP_TITLES_FILE)
+            found = popular['tconst'].isin(movies['tconst'])
+            titles = movies.loc[movies['tconst'].isin(popular['tconst']), 'originalTitle']
+            titles = [movies['originalTitle'].iloc[DEFAULT_MOVIE_INDEX]] + list(titles.drop_duplicates())
+        except Exception as e:
+            # The recommendations can still be computed on request, the instance is marked ready anyway
+            logger.exception('Recommendations warm-up could not start, the instance is marked ready without it')
+            with self.lock:
+                self.state = 'failed'
+                self.error = str(e)
+            self.write_status()
+            self.write_ready()
+            return
+
+        if not found.any():
+            logger.error('None of the movies of %s are in the database, only the default movie will be warmed up',
+                WARMUP_TITLES_FILE)
+        elif not found.all():
+            logger.warning('%d of the %d movies of %s are not in the database and will not be warmed up',
+                (~found).sum(), len(popular), WARMUP_TITLES_FILE)
+
+        with self.lock:
+            self.titles = titles
+            self.missing = int((~found).sum())
+            self.state = 'warming'
+        self.write_status()
+
+        for title in titles:
+            # A failing movie is skipped, it will be computed on request instead
+            try:
+                self.get_recommendations(title, movies)
+            except Exception:
+                logger.exception('Recommendations warm-up failed for %s', title)
+                with self.lock:
+                    self.failed += 1
+            with self.lock:
+                self.done += 1
+            self.write_status()
+
+        # The instance is only warm if at least the default movie was precomputed
+        with self.lock:
+            warm = titles[0] in self.results
+            if warm:
+                self.state = 'ready'
+            else:
+                self.state = 'failed'
+                self.error = f'No recommendations for the default movie {titles[0]}'
+        self.write_status()
+        if warm:
+            self.write_ready()
+        else:
+            logger.error('Recommendations warm-up failed for the default movie, the instance is not marked ready')
+
+    def get_recommendations(self, title, movies):
+        # Only the precomputed movies are kept, the others are scanned on every request
+        with self.lock:
+            if title in self.results:
+                return self.results[title]
+            event = self.in_flight.get(title)
+            owner = event is None and title in self.titles
+            if owner:
+                event = self.in_flight[title] = threading.Event()
+
+        # Wait for the same movie being computed by another thread instead of scanning twice
+        if event is not None and not owner:
+            event.wait()
+            with self.lock:
+                if title in self.results:
+                    return self.results[title]
+
+        try:
+            movie_data = movies.loc[movies['originalTitle']==title,'data'].values[0]
+            results = get_recommendations(movie_data, movies)
+            if owner:
+                with self.lock:
+                    self.results[title] = results
+            return results
+        finally:
+            if owner:
+                with self.lock:
+                    del self.in_flight[title]
+                event.set()
+
+    def status(self):
+        with self.lock:
+            return {
+                'state': self.state,
+                'done': self.done,
+                'total': len(self.titles),
+                'failed': self.failed,
+                'missing': self.missing,
+                'error': self.error,
+            }
+
+    def write_ready(self):
+        with open(WARMUP_READY_FILE, 'w') as f:
+            f.write(f'{self.done}\n')
+
+    def write_status(self):
+        # Written to a temporary file first so that a health check never reads a partial file
+        temp_file = WARMUP_STATUS_FILE + '.tmp'
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(self.status(), f)
+            os.replace(temp_file, WARMUP_STATUS_FILE)
+        except OSError:
+            logger.exception('Could not write the warm-up status to %s', WARMUP_STATUS_FILE)
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def start_warmup():
+    # Streamlit runs app.py again on every interaction, the module keeps a single warm-up per process
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = RecommendationsWarmup()
+            _warmup.start()
+    return _warmup